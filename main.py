@@ -7,22 +7,134 @@ from PubMed and Cochrane for systematic reviews.
 
 import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox, filedialog
+import numpy as np
 import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import re
-import csv
+import io
 import os
+import contextlib
 from datetime import datetime
 import threading
+from collections import deque
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from urllib.parse import urlencode
-from xml.etree import ElementTree as ET
+from lxml import etree
 try:
     from Bio import Entrez
     BIOPYTHON_AVAILABLE = True
 except ImportError:
     BIOPYTHON_AVAILABLE = False
     print("Warning: Biopython not available. PubMed search will use alternative method.")
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+try:
+    import requests_cache
+    REQUESTS_CACHE_AVAILABLE = True
+except ImportError:
+    REQUESTS_CACHE_AVAILABLE = False
+
+# Entrez responses are cached for a day, but esearch only as long as NCBI keeps
+# the WebEnv it returns alive, so cached searches never point at expired history
+ENTREZ_CACHE_EXPIRY = 24 * 60 * 60
+ENTREZ_HISTORY_EXPIRY = 8 * 60 * 60
+
+# Number of included articles the results preview renders per page
+PREVIEW_WINDOW = 200
+
+# Rule drawn under each section heading of the results preview
+SEP = "-" * 50 + "\n"
+
+# Column order of every article record; screening status is kept apart, in self.status
+ARTICLE_FIELDS = ['Sr_No', 'Title', 'ID_Link', 'Abstract', 'Authors', 'Source']
+
+# Column order of search_results.csv and of the screening exports
+SEARCH_RESULT_FIELDS = ARTICLE_FIELDS + ['Status']
+EXPORT_FIELDS = SEARCH_RESULT_FIELDS + ['Decision_Date']
+
+# Screening status codes, and the label each one exports as
+PENDING, INCLUDED, EXCLUDED = 0, 1, 2
+STATUS_LABELS = np.array(['Pending', 'Included', 'Excluded'], dtype=object)
+
+# Fields that can never hold a delimiter, quote or line break, so CSV writers skip scanning them
+CLEAN_CSV_FIELDS = frozenset(['Sr_No', 'Status', 'Decision_Date'])
+
+# Characters that make csv.QUOTE_MINIMAL quote a field
+CSV_SPECIAL_RE = re.compile(r'[",\r\n]')
+
+
+def open_csv_for_writing(filename):
+    """Open a CSV file for row-by-row streaming through a 1 MiB write buffer"""
+    return open(filename, 'w', newline='', encoding='utf-8', buffering=1 << 20)
+
+
+def new_article_columns():
+    """Return an empty column store holding one list per article field"""
+    return {field: [] for field in ARTICLE_FIELDS}
+
+
+def append_article(columns, article):
+    """Append one article record to a column store"""
+    for field in ARTICLE_FIELDS:
+        columns[field].append(article[field])
+
+
+def extend_article_columns(columns, other):
+    """Append every article of another column store"""
+    for field in ARTICLE_FIELDS:
+        columns[field].extend(other[field])
+
+
+def csv_field(value):
+    """Quote one CSV field the way csv.QUOTE_MINIMAL does"""
+    if CSV_SPECIAL_RE.search(value):
+        return '"' + value.replace('"', '""') + '"'
+    return value
+
+
+def csv_column(values, clean=False):
+    """Return a column's values as ready-to-join CSV fields"""
+    fields = ['' if value is None else str(value) for value in values]
+    if clean:
+        return fields
+    # One search over the joined column rules out quoting for every cell at once
+    if CSV_SPECIAL_RE.search('\x00'.join(fields)) is None:
+        return fields
+    return [csv_field(field) for field in fields]
+
+
+def write_csv_columns(f, header, columns):
+    """Write columns as CSV rows, only quote-scanning columns not in CLEAN_CSV_FIELDS"""
+    fields = [csv_column(column, name in CLEAN_CSV_FIELDS) for name, column in zip(header, columns)]
+    f.write(','.join(header) + '\r\n')
+    f.writelines(','.join(row) + '\r\n' for row in zip(*fields))
+
+
+class RateLimiter:
+    """Thread-safe limiter that spaces calls to at most `rate` per second"""
+    
+    def __init__(self, rate):
+        self.interval = 1.0 / rate
+        self.lock = threading.Lock()
+        self.next_slot = time.monotonic()
+    
+    def acquire(self):
+        """Block until the caller may issue its next request"""
+        with self.lock:
+            now = time.monotonic()
+            slot = max(self.next_slot, now)
+            self.next_slot = slot + self.interval
+        
+        delay = slot - now
+        if delay > 0:
+            time.sleep(delay)
+
 
 class SystematicReviewTool:
     def __init__(self, root):
@@ -31,16 +143,59 @@ class SystematicReviewTool:
         self.root.geometry("1000x700")
         self.root.minsize(800, 600)
         
-        # Data storage
-        self.all_articles = []
+        # Data storage: articles are kept column-wise, one list per field
+        self.articles = new_article_columns()
         self.current_index = 0
-        self.included_articles = []
-        self.excluded_articles = []
         self.inclusion_keywords = []
         
+        # Screening decisions, one slot per article: a status code and the
+        # decision time as epoch nanoseconds (0 while the article is pending).
+        # Stamps strictly increase, so they also give the order decisions were made in
+        self.status = np.zeros(0, dtype=np.int8)
+        self.decision_times = np.zeros(0, dtype=np.int64)
+        self._last_decision_time = 0
+        
+        # Undecided article indices in screening order; entries decided out of order stay
+        # queued until they reach the front, where self.status shows they are done
+        self.pending = deque()
+        
+        # Decided article indices in decision order. A re-decision blanks the article's
+        # old entry (found through _history_slot) and appends a new one. Previous/Next
+        # move _history_pos through it; it equals len(history) outside the history
+        self.history = []
+        self._history_slot = {}
+        self._history_pos = 0
+        
+        # Running counts, kept in step with every status change; the total is set per search
+        self._n_total = 0
+        self._n_included = 0
+        self._n_excluded = 0
+        self._n_pubmed = 0
+        self._n_cochrane = 0
+        
+        # Compiled keyword matcher, rebuilt whenever the keywords change
+        self._kw_set = frozenset()
+        self._kw_re = None
+        self._ac = None
+        
+        # Keyword match offsets per article index, valid for the current keywords
+        self._highlight_spans = {}
+        
+        # Pending debounced re-render of the results preview
+        self._preview_dirty = False
+        self._preview_job = None
+        self._preview_limit = PREVIEW_WINDOW
+        
         # Email for PubMed API (required by NCBI)
         self.email = "your.email@example.com"  # User should change this
         
+        # Optional NCBI API key (raises the rate limit from 3 to 10 requests/second)
+        self.api_key = ""
+        
+        # HTTP session shared by all Entrez calls, backed by an SQLite cache when available
+        self.use_cache = True
+        self._http = self.create_http_session()
+        
         self.setup_ui()
         
     def setup_ui(self):
@@ -48,6 +203,7 @@ class SystematicReviewTool:
         # Create notebook for tabs
         notebook = ttk.Notebook(self.root)
         notebook.pack(fill='both', expand=True, padx=10, pady=10)
+        self.notebook = notebook
         
         # Tab 1: Search
         self.search_frame = ttk.Frame(notebook)
@@ -64,6 +220,9 @@ class SystematicReviewTool:
         notebook.add(self.results_frame, text="Results")
         self.setup_results_tab()
         
+        # The results preview is only rendered while its tab is showing
+        notebook.bind('<<NotebookTabChanged>>', self.on_tab_changed)
+        
     def setup_search_tab(self):
         """Setup the search and retrieval tab"""
         # Email configuration
@@ -75,6 +234,18 @@ class SystematicReviewTool:
         email_entry = ttk.Entry(email_frame, textvariable=self.email_var, width=50)
         email_entry.pack(fill='x', pady=2)
         
+        ttk.Label(email_frame, text="NCBI API key (optional):").pack(anchor='w', pady=(10,0))
+        self.api_key_var = tk.StringVar(value=self.api_key)
+        api_key_entry = ttk.Entry(email_frame, textvariable=self.api_key_var, width=50)
+        api_key_entry.pack(fill='x', pady=2)
+        
+        self.use_cache_var = tk.BooleanVar(value=self.use_cache)
+        cache_check = ttk.Checkbutton(email_frame, text="Cache PubMed responses for 24 hours",
+                                      variable=self.use_cache_var)
+        cache_check.pack(anchor='w', pady=(5,0))
+        if not REQUESTS_CACHE_AVAILABLE:
+            cache_check.config(state='disabled')
+        
         # Search terms
         search_frame = ttk.LabelFrame(self.search_frame, text="Search Parameters", padding=10)
         search_frame.pack(fill='x', padx=10, pady=5)
@@ -125,8 +296,23 @@ class SystematicReviewTool:
         results_frame = ttk.LabelFrame(self.search_frame, text="Search Results Preview", padding=10)
         results_frame.pack(fill='both', expand=True, padx=10, pady=5)
         
-        self.results_text = scrolledtext.ScrolledText(results_frame, height=15)
-        self.results_text.pack(fill='both', expand=True)
+        self.results_summary_var = tk.StringVar(value="No search performed yet")
+        ttk.Label(results_frame, textvariable=self.results_summary_var, justify='left').pack(anchor='w', pady=(0,5))
+        
+        # Treeview only draws the visible rows, so every result can be listed
+        tree_frame = ttk.Frame(results_frame)
+        tree_frame.pack(fill='both', expand=True)
+        
+        columns = ('Title', 'Authors', 'ID', 'Source')
+        self.results_tree = ttk.Treeview(tree_frame, columns=columns, show='headings', height=15)
+        for column, width in zip(columns, (400, 250, 120, 80)):
+            self.results_tree.heading(column, text=column)
+            self.results_tree.column(column, width=width, stretch=(column == 'Title'))
+        
+        tree_scrollbar = ttk.Scrollbar(tree_frame, orient='vertical', command=self.results_tree.yview)
+        self.results_tree.configure(yscrollcommand=tree_scrollbar.set)
+        tree_scrollbar.pack(side='right', fill='y')
+        self.results_tree.pack(side='left', fill='both', expand=True)
         
     def setup_screening_tab(self):
         """Setup the article screening tab"""
@@ -206,9 +392,17 @@ class SystematicReviewTool:
         preview_frame = ttk.LabelFrame(self.results_frame, text="Results Preview", padding=10)
         preview_frame.pack(fill='both', expand=True, padx=10, pady=5)
         
+        # Shown only when more included articles exist than the preview renders
+        self.load_more_button = ttk.Button(preview_frame, text="Load more included articles",
+                                           command=self.load_more_preview)
+        
         self.results_preview = scrolledtext.ScrolledText(preview_frame, height=15)
         self.results_preview.pack(fill='both', expand=True)
         
+    def article_count(self):
+        """Number of articles currently loaded"""
+        return self._n_total
+    
     def select_cochrane_file(self):
         """Select Cochrane CSV file"""
         filename = filedialog.askopenfilename(
@@ -221,6 +415,9 @@ class SystematicReviewTool:
     def start_search(self):
         """Start the search process in a separate thread"""
         self.email = self.email_var.get().strip()
+        self.api_key = self.api_key_var.get().strip()
+        self.use_cache = self.use_cache_var.get()
+        self._http.headers['User-Agent'] = 'SystematicReviewTool/1.0 (mailto:%s)' % self.email
         search_terms = self.search_var.get().strip()
         
         if not search_terms:
@@ -241,57 +438,145 @@ class SystematicReviewTool:
         self.search_button.config(state='disabled')
         self.progress_var.set("Searching...")
         
+        # Read Tk variables here; the worker thread must not touch them
+        cochrane_file = self.cochrane_file_var.get() if self.cochrane_var.get() else ''
+        
         search_thread = threading.Thread(target=self.perform_search, 
-                                        args=(search_terms, max_results))
+                                        args=(search_terms, max_results,
+                                              self.pubmed_var.get(), cochrane_file))
         search_thread.daemon = True
         search_thread.start()
     
-    def perform_search(self, search_terms, max_results):
-        """Perform the actual search"""
+    def run_on_ui(self, callback, *args):
+        """Schedule a callback on the Tk main loop (safe to call from worker threads)"""
+        self.root.after(0, callback, *args)
+    
+    def set_progress(self, message):
+        """Update the search progress label from any thread"""
+        self.run_on_ui(self.progress_var.set, message)
+    
+    def perform_search(self, search_terms, max_results, use_pubmed, cochrane_file):
+        """Perform the actual search (runs on a worker thread)"""
         try:
-            self.all_articles = []
+            articles = new_article_columns()
+            n_pubmed = 0
+            n_cochrane = 0
             
             # Search PubMed
-            if self.pubmed_var.get():
-                self.progress_var.set("Searching PubMed...")
-                pubmed_articles = self.search_pubmed(search_terms, max_results)
-                self.all_articles.extend(pubmed_articles)
-                self.progress_var.set(f"Found {len(pubmed_articles)} PubMed articles")
-                time.sleep(0.5)
+            if use_pubmed:
+                self.set_progress("Searching PubMed...")
+                with self.http_cache_scope():
+                    pubmed_articles = self.search_pubmed(search_terms, max_results)
+                extend_article_columns(articles, pubmed_articles)
+                n_pubmed = len(pubmed_articles['Sr_No'])
+                self.set_progress(f"Found {n_pubmed} PubMed articles")
             
             # Load Cochrane CSV
-            if self.cochrane_var.get() and self.cochrane_file_var.get():
-                self.progress_var.set("Loading Cochrane articles...")
-                cochrane_articles = self.load_cochrane_csv(self.cochrane_file_var.get())
-                self.all_articles.extend(cochrane_articles)
-                self.progress_var.set(f"Loaded {len(cochrane_articles)} Cochrane articles")
-                time.sleep(0.5)
+            if cochrane_file:
+                self.set_progress("Loading Cochrane articles...")
+                cochrane_articles = self.load_cochrane_csv(cochrane_file, n_pubmed)
+                extend_article_columns(articles, cochrane_articles)
+                n_cochrane = len(cochrane_articles['Sr_No'])
+                self.set_progress(f"Loaded {n_cochrane} Cochrane articles")
+            
+            # Hand the results to the Tk thread, which owns all widgets and state
+            self.run_on_ui(self.finish_search, articles, n_pubmed, n_cochrane)
+                
+        except Exception as e:
+            self.run_on_ui(self.search_failed, str(e))
+    
+    def finish_search(self, articles, n_pubmed, n_cochrane):
+        """Install search results and refresh the UI"""
+        try:
+            self.articles = articles
+            self._n_total = len(articles['Sr_No'])
+            self._highlight_spans = {}
+            
+            self.status = np.full(self.article_count(), PENDING, dtype=np.int8)
+            self.decision_times = np.zeros(self.article_count(), dtype=np.int64)
+            self._n_included = 0
+            self._n_excluded = 0
+            self._preview_limit = PREVIEW_WINDOW
+            self.pending = deque(range(self.article_count()))
+            self.history = []
+            self._history_slot = {}
+            self._history_pos = 0
+            self._n_pubmed = n_pubmed
+            self._n_cochrane = n_cochrane
             
             # Save to CSV
-            if self.all_articles:
+            if self.article_count():
                 self.save_search_results()
                 self.display_search_results()
-                self.progress_var.set(f"Search completed! Found {len(self.all_articles)} total articles")
+                self.progress_var.set(f"Search completed! Found {self.article_count()} total articles")
                 
                 # Initialize screening
                 self.current_index = 0
                 self.update_screening_display()
             else:
                 self.progress_var.set("No articles found")
-                
         except Exception as e:
-            self.progress_var.set(f"Error: {str(e)}")
-            messagebox.showerror("Search Error", f"An error occurred during search: {str(e)}")
+            self.search_failed(str(e))
         finally:
             self.search_button.config(state='normal')
     
+    def search_failed(self, message):
+        """Report a search error and re-enable searching"""
+        self.progress_var.set(f"Error: {message}")
+        messagebox.showerror("Search Error", f"An error occurred during search: {message}")
+        self.search_button.config(state='normal')
+    
+    def create_http_session(self):
+        """Create the keep-alive HTTP session used for Entrez requests"""
+        if REQUESTS_CACHE_AVAILABLE:
+            session = requests_cache.CachedSession(
+                '.entrez_cache',
+                backend='sqlite',
+                expire_after=ENTREZ_CACHE_EXPIRY,
+                urls_expire_after={'*esearch.fcgi*': ENTREZ_HISTORY_EXPIRY}
+            )
+        else:
+            session = requests.Session()
+        
+        # Pool enough connections for the fetch workers and back off on
+        # NCBI rate limiting (429) and transient server errors
+        retries = Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504])
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=retries)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+    
+    def cache_enabled(self):
+        """Check whether Entrez responses are served from the on-disk cache"""
+        return REQUESTS_CACHE_AVAILABLE and self.use_cache
+    
+    def http_cache_scope(self):
+        """Context that bypasses the response cache when the user turned it off"""
+        if REQUESTS_CACHE_AVAILABLE and not self.use_cache:
+            return self._http.cache_disabled()
+        return contextlib.nullcontext()
+    
+    def entrez_get(self, url, params, limiter, **kwargs):
+        """GET an Entrez URL, taking a rate-limit slot only if it has to go to NCBI"""
+        if self.cache_enabled():
+            # requests-cache answers 504 when nothing fresh is cached for the request
+            response = self._http.get(url, params=params, only_if_cached=True, **kwargs)
+            if response.status_code != 504:
+                return response
+        
+        limiter.acquire()
+        return self._http.get(url, params=params, **kwargs)
+    
     def search_pubmed(self, search_terms, max_results):
         """Search PubMed using Biopython or direct API"""
-        articles = []
+        articles = new_article_columns()
         
-        if BIOPYTHON_AVAILABLE:
+        # Biopython bypasses the session, so cached searches go through the direct API
+        if BIOPYTHON_AVAILABLE and not self.cache_enabled():
             try:
                 Entrez.email = self.email
+                # Always assign, so a key cleared in the UI stops being sent
+                Entrez.api_key = self.api_key or None
                 
                 # Search for article IDs
                 handle = Entrez.esearch(db="pubmed", term=search_terms, retmax=max_results)
@@ -309,7 +594,8 @@ class SystematicReviewTool:
                     for i, record in enumerate(records['PubmedArticle']):
                         try:
                             article = self.parse_pubmed_record(record, i + 1)
-                            articles.append(article)
+                            if article:
+                                append_article(articles, article)
                         except Exception as e:
                             print(f"Error parsing record {i}: {e}")
                             continue
@@ -325,60 +611,138 @@ class SystematicReviewTool:
     
     def search_pubmed_direct(self, search_terms, max_results):
         """Direct PubMed API search without Biopython"""
-        articles = []
+        articles = new_article_columns()
         
         try:
+            # NCBI allows 10 requests/second with an API key, 3 without
+            limiter = RateLimiter(10 if self.api_key else 3)
+            
             # Search for PMIDs
             search_url = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/esearch.fcgi"
             search_params = {
                 'db': 'pubmed',
                 'term': search_terms,
-                'retmax': max_results,
+                'retmax': 0,
                 'retmode': 'json',
+                'usehistory': 'y',
                 'email': self.email
             }
+            if self.api_key:
+                search_params['api_key'] = self.api_key
             
-            response = requests.get(search_url, params=search_params, timeout=30)
+            response = self.entrez_get(search_url, search_params, limiter, timeout=30)
             response.raise_for_status()
-            search_data = response.json()
+            pages, failed = self.fetch_pubmed_pages(response.json().get('esearchresult', {}),
+                                                    max_results, limiter)
             
-            pmids = search_data.get('esearchresult', {}).get('idlist', [])
+            if failed and getattr(response, 'from_cache', False):
+                # A cached esearch can name a WebEnv NCBI has already dropped; start a
+                # fresh history session, overwrite the cached one, and fetch again under it
+                self.set_progress("Cached PubMed session expired, searching again...")
+                limiter.acquire()
+                response = self._http.get(search_url, params=search_params, timeout=30,
+                                          force_refresh=True)
+                response.raise_for_status()
+                pages, failed = self.fetch_pubmed_pages(response.json().get('esearchresult', {}),
+                                                        max_results, limiter)
+            
+            # Collect in submission order so Sr_No follows PubMed ranking
+            for page in pages:
+                for article in page:
+                    article['Sr_No'] = len(articles['Sr_No']) + 1
+                    append_article(articles, article)
+            
+            if failed:
+                self.run_on_ui(messagebox.showwarning, "Incomplete PubMed Results",
+                               f"{failed} of {failed + len(pages)} PubMed batches could not be "
+                               f"fetched, so the PubMed results are incomplete.")
             
-            if pmids:
-                # Fetch article details in batches
-                fetch_url = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/efetch.fcgi"
-                
-                batch_size = 100
-                for i in range(0, len(pmids), batch_size):
-                    batch_pmids = pmids[i:i + batch_size]
-                    
-                    fetch_params = {
-                        'db': 'pubmed',
-                        'id': ','.join(batch_pmids),
-                        'rettype': 'xml',
-                        'retmode': 'xml',
-                        'email': self.email
-                    }
-                    
-                    response = requests.get(fetch_url, params=fetch_params, timeout=60)
-                    response.raise_for_status()
-                    
-                    # Parse XML
-                    root = ET.fromstring(response.text)
-                    
-                    for j, pubmed_article in enumerate(root.findall('.//PubmedArticle')):
-                        try:
-                            article = self.parse_pubmed_xml(pubmed_article, len(articles) + 1)
-                            articles.append(article)
-                        except Exception as e:
-                            print(f"Error parsing XML record {j}: {e}")
-                            continue
-                            
         except Exception as e:
             print(f"Direct PubMed search failed: {e}")
         
         return articles
     
+    def fetch_pubmed_pages(self, search_data, max_results, limiter):
+        """Fetch every page of an esearch result set; return the parsed pages and the failure count"""
+        # The result set stays on the history server; page through it by offset
+        webenv = search_data.get('webenv')
+        querykey = search_data.get('querykey')
+        total = min(int(search_data.get('count', 0)), max_results)
+        if not (webenv and querykey and total):
+            return [], 0
+        
+        # Fetch article details in concurrent batches
+        batch_size = 200
+        batches = [(retstart, min(batch_size, total - retstart))
+                   for retstart in range(0, total, batch_size)]
+        
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = [executor.submit(self.fetch_pubmed_batch, webenv, querykey,
+                                       retstart, retmax, limiter)
+                       for retstart, retmax in batches]
+            
+            done = 0
+            for _ in as_completed(futures):
+                done += 1
+                self.set_progress(f"Fetched {done} of {len(futures)} PubMed batches...")
+        
+        # A failed batch is counted rather than raised, so the other pages survive
+        pages = []
+        failed = 0
+        for (retstart, _), future in zip(batches, futures):
+            try:
+                pages.append(future.result())
+            except Exception as e:
+                print(f"PubMed batch at offset {retstart} failed: {e}")
+                failed += 1
+        return pages, failed
+    
+    def fetch_pubmed_batch(self, webenv, querykey, retstart, retmax, limiter):
+        """Fetch and parse one page of a history-server result set"""
+        fetch_url = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/efetch.fcgi"
+        fetch_params = {
+            'db': 'pubmed',
+            'WebEnv': webenv,
+            'query_key': querykey,
+            'retstart': retstart,
+            'retmax': retmax,
+            'rettype': 'xml',
+            'retmode': 'xml',
+            'email': self.email
+        }
+        if self.api_key:
+            fetch_params['api_key'] = self.api_key
+        
+        response = self.entrez_get(fetch_url, fetch_params, limiter, timeout=60, stream=True)
+        response.raise_for_status()
+        
+        if self.cache_enabled():
+            # The cache has already buffered the body; parse it from memory
+            source = io.BytesIO(response.content)
+        else:
+            # Let urllib3 undo any gzip transfer encoding while lxml reads the stream
+            response.raw.decode_content = True
+            source = response.raw
+        
+        # Parse XML one PubmedArticle at a time instead of building the whole tree
+        articles = []
+        with response:
+            for j, (_, pubmed_article) in enumerate(
+                    etree.iterparse(source, tag='PubmedArticle', huge_tree=True)):
+                try:
+                    article = self.parse_pubmed_xml(pubmed_article, retstart + j + 1)
+                    if article:
+                        articles.append(article)
+                except Exception as e:
+                    print(f"Error parsing XML record {retstart + j}: {e}")
+                finally:
+                    # Drop the parsed record and any siblings already processed
+                    pubmed_article.clear()
+                    while pubmed_article.getprevious() is not None:
+                        del pubmed_article.getparent()[0]
+        
+        return articles
+    
     def parse_pubmed_record(self, record, sr_no):
         """Parse PubMed record from Biopython"""
         try:
@@ -397,15 +761,9 @@ class SystematicReviewTool:
                     abstract = str(abstract_list)
             
             # Parse authors
-            author_list = article.get('AuthorList', [])
-            authors = []
-            for author in author_list:
-                if 'LastName' in author and 'ForeName' in author:
-                    authors.append(f"{author['LastName']} {author['ForeName']}")
-                elif 'CollectiveName' in author:
-                    authors.append(author['CollectiveName'])
-            
-            authors_str = '; '.join(authors) if authors else 'No authors listed'
+            authors_str = '; '.join(filter(None, map(
+                self.format_record_author, article.get('AuthorList', [])
+            ))) or 'No authors listed'
             
             return {
                 'Sr_No': sr_no,
@@ -413,63 +771,25 @@ class SystematicReviewTool:
                 'ID_Link': f"PMID: {pmid}",
                 'Abstract': abstract,
                 'Authors': authors_str,
-                'Source': 'PubMed',
-                'Status': 'Pending'
+                'Source': 'PubMed'
             }
         except Exception as e:
             print(f"Error parsing Biopython record: {e}")
             return None
     
-    def parse_pubmed_xml(self, pubmed_article, sr_no):
-        """Parse PubMed XML directly"""
-        try:
-            # Extract basic information
-            article = pubmed_article.find('.//Article')
-            
-            title_elem = article.find('ArticleTitle')
-            title = title_elem.text if title_elem is not None else 'No title'
-            
-            pmid_elem = pubmed_article.find('.//PMID')
-            pmid = pmid_elem.text if pmid_elem is not None else ''
-            
-            # Extract abstract
-            abstract_text = ""
-            abstract_elem = article.find('.//Abstract')
-            if abstract_elem is not None:
-                abstract_parts = []
-                for text_elem in abstract_elem.findall('.//AbstractText'):
-                    if text_elem.text:
-                        abstract_parts.append(text_elem.text)
-                abstract_text = ' '.join(abstract_parts)
-            
-            # Extract authors
-            authors = []
-            author_list = article.find('.//AuthorList')
-            if author_list is not None:
-                for author in author_list.findall('Author'):
-                    last_name = author.find('LastName')
-                    fore_name = author.find('ForeName')
-                    collective_name = author.find('CollectiveName')
-                    
-                    if last_name is not None and fore_name is not None:
-                        authors.append(f"{last_name.text} {fore_name.text}")
-                    elif collective_name is not None:
-                        authors.append(collective_name.text)
-            
-            authors_str = '; '.join(authors) if authors else 'No authors listed'
-            
-            return {
-                'Sr_No': sr_no,
-                'Title': title,
-                'ID_Link': f"PMID: {pmid}",
-                'Abstract': abstract_text,
-'Authors': authors_str,
-                'Source': 'PubMed',
-                'Status': 'Pending'
-            }
-        except Exception as e:
-            print(f"Error parsing Biopython record: {e}")
-            return None
+    def format_record_author(self, author):
+        """Format a Biopython author entry as 'Last Fore' or its collective name"""
+        if 'LastName' in author and 'ForeName' in author:
+            return f"{author['LastName']} {author['ForeName']}"
+        return author.get('CollectiveName', '')
+    
+    def format_xml_author(self, author):
+        """Format an <Author> element as 'Last Fore' or its collective name"""
+        last_name = author.findtext('LastName')
+        fore_name = author.findtext('ForeName')
+        if last_name is not None and fore_name is not None:
+            return f"{last_name} {fore_name}"
+        return author.findtext('CollectiveName') or ''
     
     def parse_pubmed_xml(self, pubmed_article, sr_no):
         """Parse PubMed XML directly"""
@@ -477,37 +797,19 @@ class SystematicReviewTool:
             # Extract basic information
             article = pubmed_article.find('.//Article')
             
-            title_elem = article.find('ArticleTitle')
-            title = title_elem.text if title_elem is not None else 'No title'
-            
-            pmid_elem = pubmed_article.find('.//PMID')
-            pmid = pmid_elem.text if pmid_elem is not None else ''
+            title = article.findtext('ArticleTitle') or 'No title'
+            pmid = pubmed_article.findtext('.//PMID') or ''
             
             # Extract abstract
-            abstract_text = ""
-            abstract_elem = article.find('.//Abstract')
-            if abstract_elem is not None:
-                abstract_parts = []
-                for text_elem in abstract_elem.findall('.//AbstractText'):
-                    if text_elem.text:
-                        abstract_parts.append(text_elem.text)
-                abstract_text = ' '.join(abstract_parts)
+            abstract_text = ' '.join(
+                text_elem.text for text_elem in article.iterfind('.//Abstract/AbstractText')
+                if text_elem.text
+            )
             
             # Extract authors
-            authors = []
-            author_list = article.find('.//AuthorList')
-            if author_list is not None:
-                for author in author_list.findall('Author'):
-                    last_name = author.find('LastName')
-                    fore_name = author.find('ForeName')
-                    collective_name = author.find('CollectiveName')
-                    
-                    if last_name is not None and fore_name is not None:
-                        authors.append(f"{last_name.text} {fore_name.text}")
-                    elif collective_name is not None:
-                        authors.append(collective_name.text)
-            
-            authors_str = '; '.join(authors) if authors else 'No authors listed'
+            authors_str = '; '.join(filter(None, map(
+                self.format_xml_author, article.iterfind('.//AuthorList/Author')
+            ))) or 'No authors listed'
             
             return {
                 'Sr_No': sr_no,
@@ -515,20 +817,17 @@ class SystematicReviewTool:
                 'ID_Link': f"PMID: {pmid}",
                 'Abstract': abstract_text,
                 'Authors': authors_str,
-                'Source': 'PubMed',
-                'Status': 'Pending'
+                'Source': 'PubMed'
             }
         except Exception as e:
             print(f"Error parsing XML: {e}")
             return None
     
-    def load_cochrane_csv(self, filename):
-        """Load articles from Cochrane CSV file"""
-        articles = []
+    def load_cochrane_csv(self, filename, offset=0):
+        """Load articles from Cochrane CSV file, numbering them after `offset` existing articles"""
+        articles = new_article_columns()
         
         try:
-            df = pd.read_csv(filename)
-            
             # Try to map common Cochrane CSV column names
             column_mapping = {
                 'title': ['Title', 'title', 'TITLE'],
@@ -536,70 +835,77 @@ class SystematicReviewTool:
                 'abstract': ['Abstract', 'abstract', 'ABSTRACT'],
                 'doi': ['DOI', 'doi', 'ID', 'id']
             }
+            known_columns = {name for names in column_mapping.values() for name in names}
             
-            actual_columns = {}
-            for key, possible_names in column_mapping.items():
-                for name in possible_names:
-                    if name in df.columns:
-                        actual_columns[key] = name
-                        break
+            # Read only the mapped columns, as plain strings, in bounded chunks.
+            # With na_filter=False blank cells arrive as '' rather than NaN, so the
+            # title/author defaults in cochrane_chunk_frame must test for ''
+            reader = pd.read_csv(filename, dtype=str, engine='c', na_filter=False,
+                                 usecols=lambda column: column in known_columns,
+                                 chunksize=50_000)
             
-            for i, row in df.iterrows():
-                try:
-                    title = row.get(actual_columns.get('title', ''), 'No title')
-                    authors = row.get(actual_columns.get('authors', ''), 'No authors listed')
-                    abstract = row.get(actual_columns.get('abstract', ''), '')
-                    doi = row.get(actual_columns.get('doi', ''), '')
-                    
-                    article = {
-                        'Sr_No': len(self.all_articles) + i + 1,
-                        'Title': str(title),
-                        'ID_Link': f"DOI: {doi}" if doi else 'No ID',
-                        'Abstract': str(abstract),
-                        'Authors': str(authors),
-                        'Source': 'Cochrane',
-                        'Status': 'Pending'
-                    }
-                    articles.append(article)
-                except Exception as e:
-                    print(f"Error processing Cochrane row {i}: {e}")
-                    continue
+            actual_columns = None
+            with reader:
+                for chunk in reader:
+                    if actual_columns is None:
+                        actual_columns = {}
+                        for key, possible_names in column_mapping.items():
+                            for name in possible_names:
+                                if name in chunk.columns:
+                                    actual_columns[key] = name
+                                    break
                     
+                    start = offset + len(articles['Sr_No']) + 1
+                    chunk_articles = self.cochrane_chunk_frame(chunk, actual_columns, start)
+                    for field in ARTICLE_FIELDS:
+                        articles[field].extend(chunk_articles[field].tolist())
+            
         except Exception as e:
-            messagebox.showerror("Error", f"Error loading Cochrane CSV: {e}")
+            self.run_on_ui(messagebox.showerror, "Error", f"Error loading Cochrane CSV: {e}")
         
         return articles
     
+    def cochrane_chunk_frame(self, chunk, actual_columns, start):
+        """Convert one chunk of a Cochrane CSV into a frame of article fields"""
+        # Pull the mapped columns out in one step; absent columns read as empty
+        sub = chunk[list(actual_columns.values())].rename(
+            columns={name: key for key, name in actual_columns.items()}
+        )
+        sub = sub.reindex(columns=['title', 'authors', 'abstract', 'doi'], fill_value='')
+        
+        # Substitute defaults for blank cells column-wide rather than row by row
+        doi = sub['doi']
+        return pd.DataFrame({
+            'Sr_No': np.arange(start, start + len(sub)),
+            'Title': sub['title'].mask(sub['title'].eq(''), 'No title'),
+            'ID_Link': np.where(doi.ne(''), 'DOI: ' + doi, 'No ID'),
+            'Abstract': sub['abstract'],
+            'Authors': sub['authors'].mask(sub['authors'].eq(''), 'No authors listed'),
+            'Source': 'Cochrane'
+        })
+    
     def save_search_results(self):
         """Save all search results to CSV"""
-        if self.all_articles:
-            df = pd.DataFrame(self.all_articles)
-            df.to_csv('search_results.csv', index=False)
+        if self.article_count():
+            # Write the columns straight out rather than building a DataFrame
+            with open_csv_for_writing('search_results.csv') as f:
+                columns = [self.articles[field] for field in ARTICLE_FIELDS]
+                columns.append(STATUS_LABELS[self.status].tolist())
+                write_csv_columns(f, SEARCH_RESULT_FIELDS, columns)
     
     def display_search_results(self):
-        """Display search results in the text widget"""
-        self.results_text.delete(1.0, tk.END)
-        
-        summary = f"Search Results Summary:\n"
-        summary += f"Total articles found: {len(self.all_articles)}\n"
-        
-        pubmed_count = sum(1 for article in self.all_articles if article['Source'] == 'PubMed')
-        cochrane_count = sum(1 for article in self.all_articles if article['Source'] == 'Cochrane')
-        
-        summary += f"PubMed articles: {pubmed_count}\n"
-        summary += f"Cochrane articles: {cochrane_count}\n\n"
-        
-        self.results_text.insert(tk.END, summary)
+        """Display search results in the results table"""
+        self.results_summary_var.set(
+            f"Total articles found: {self.article_count()} | "
+            f"PubMed articles: {self._n_pubmed} | "
+            f"Cochrane articles: {self._n_cochrane}"
+        )
         
-        # Display first few articles
-        for i, article in enumerate(self.all_articles[:5]):
-            self.results_text.insert(tk.END, f"{i+1}. {article['Title']}\n")
-            self.results_text.insert(tk.END, f"   Authors: {article['Authors']}\n")
-            self.results_text.insert(tk.END, f"   {article['ID_Link']}\n")
-            self.results_text.insert(tk.END, f"   Source: {article['Source']}\n\n")
+        self.results_tree.delete(*self.results_tree.get_children())
         
-        if len(self.all_articles) > 5:
-            self.results_text.insert(tk.END, f"... and {len(self.all_articles) - 5} more articles\n")
+        articles = self.articles
+        for row in zip(articles['Title'], articles['Authors'], articles['ID_Link'], articles['Source']):
+            self.results_tree.insert('', 'end', values=row)
     
     def update_keywords(self):
         """Update inclusion keywords"""
@@ -610,20 +916,44 @@ class SystematicReviewTool:
         else:
             self.inclusion_keywords = []
         
+        # Compile the keyword matcher once instead of on every article display
+        self._kw_set = frozenset(self.inclusion_keywords)
+        self._kw_re = None
+        self._ac = None
+        if self.inclusion_keywords:
+            # Longest keywords first so alternation also prefers the longest match.
+            # Compiled even alongside the automaton, which can't serve every text
+            keywords = sorted(self._kw_set, key=len, reverse=True)
+            pattern = '|'.join(map(re.escape, keywords))
+            self._kw_re = re.compile(pattern, re.IGNORECASE)
+            if AHOCORASICK_AVAILABLE:
+                # Automaton scans each text once, however many keywords there are
+                automaton = ahocorasick.Automaton()
+                for keyword in self._kw_set:
+                    automaton.add_word(keyword, keyword)
+                automaton.make_automaton()
+                self._ac = automaton
+        
+        # Scan every abstract once now so navigating between articles does no matching
+        self._highlight_spans = {
+            i: self.find_keyword_spans(abstract)
+            for i, abstract in enumerate(self.articles['Abstract'])
+        }
+        
         # Refresh current article display
-        if self.all_articles and 0 <= self.current_index < len(self.all_articles):
+        if 0 <= self.current_index < self.article_count():
             self.display_current_article()
     
     def update_screening_display(self):
         """Update the screening progress display"""
-        if not self.all_articles:
+        if not self.article_count():
             self.screening_progress_var.set("No articles loaded")
             return
         
-        total = len(self.all_articles)
+        total = self.article_count()
         current = self.current_index + 1
-        included = len(self.included_articles)
-        excluded = len(self.excluded_articles)
+        included = self._n_included
+        excluded = self._n_excluded
         
         self.screening_progress_var.set(
             f"Article {current} of {total} | Included: {included} | Excluded: {excluded}"
@@ -634,122 +964,250 @@ class SystematicReviewTool:
     
     def display_current_article(self):
         """Display the current article with keyword highlighting"""
-        if not self.all_articles or self.current_index >= len(self.all_articles):
+        if self.current_index >= self.article_count():
             self.article_display.delete(1.0, tk.END)
             self.article_display.insert(tk.END, "No more articles to review")
             return
         
-        article = self.all_articles[self.current_index]
+        articles = self.articles
+        i = self.current_index
         
         # Clear display
         self.article_display.delete(1.0, tk.END)
         
         # Display title
-        title_text = f"TITLE: {article['Title']}\n\n"
+        title_text = f"TITLE: {articles['Title'][i]}\n\n"
         self.article_display.insert(tk.END, title_text, "title")
         
         # Display authors
-        authors_text = f"AUTHORS: {article['Authors']}\n\n"
+        authors_text = f"AUTHORS: {articles['Authors'][i]}\n\n"
         self.article_display.insert(tk.END, authors_text, "authors")
         
         # Display ID/Link
-        id_text = f"ID: {article['ID_Link']}\n\n"
+        id_text = f"ID: {articles['ID_Link'][i]}\n\n"
         self.article_display.insert(tk.END, id_text)
         
         # Display abstract with highlighting
-        abstract_text = f"ABSTRACT:\n{article['Abstract']}\n\n"
-        self.insert_text_with_highlights(abstract_text, "abstract")
+        self.article_display.insert(tk.END, "ABSTRACT:\n", "abstract")
+        spans = self.article_highlight_spans(i)
+        self.insert_text_with_highlights(articles['Abstract'][i], "abstract", spans)
+        self.article_display.insert(tk.END, "\n\n", "abstract")
         
         # Display source
-        source_text = f"SOURCE: {article['Source']}\n"
+        source_text = f"SOURCE: {articles['Source'][i]}\n"
         self.article_display.insert(tk.END, source_text)
     
-    def insert_text_with_highlights(self, text, tag):
-        """Insert text with keyword highlighting"""
-        if not self.inclusion_keywords:
-            self.article_display.insert(tk.END, text, tag)
-            return
-        
-        # Create pattern for all keywords
-        patterns = []
-        for keyword in self.inclusion_keywords:
-            patterns.append(re.escape(keyword))
-        
-        if not patterns:
-            self.article_display.insert(tk.END, text, tag)
-            return
-        
-        pattern = '|'.join(patterns)
-        
-        # Split text by matches
-        parts = re.split(f'({pattern})', text, flags=re.IGNORECASE)
-        
-        for part in parts:
-            if part.lower() in [kw.lower() for kw in self.inclusion_keywords]:
-                self.article_display.insert(tk.END, part, "highlight")
-            else:
-                self.article_display.insert(tk.END, part, tag)
+    def find_keyword_spans(self, text):
+        """Return non-overlapping (start, end) offsets of keyword matches in text"""
+        if not self._kw_set:
+            return []
+        
+        text_lower = text.lower()
+        
+        # Lowercasing can change the length of some characters (e.g. 'İ'), and then
+        # offsets into text_lower no longer line up with text; use the regex there
+        if self._ac is not None and len(text_lower) == len(text):
+            # Automaton reports every match by end index; keep leftmost-longest ones
+            matches = sorted(
+                ((end - len(keyword) + 1, end + 1) for end, keyword in self._ac.iter(text_lower)),
+                key=lambda match: (match[0], -match[1])
+            )
+            spans = []
+            last_end = 0
+            for start, end in matches:
+                if start >= last_end:
+                    spans.append((start, end))
+                    last_end = end
+            return spans
+        
+        # Most abstracts contain no keyword at all; plain substring checks rule
+        # that out far more cheaply than a case-insensitive regex pass
+        if not any(keyword in text_lower for keyword in self._kw_set):
+            return []
+        
+        return [match.span() for match in self._kw_re.finditer(text)]
+    
+    def article_highlight_spans(self, index):
+        """Return the cached keyword spans for an article's abstract"""
+        spans = self._highlight_spans.get(index)
+        if spans is None:
+            spans = self.find_keyword_spans(self.articles['Abstract'][index])
+            self._highlight_spans[index] = spans
+        return spans
+    
+    def insert_text_with_highlights(self, text, tag, spans):
+        """Insert text and highlight the given (start, end) keyword spans"""
+        # Insert the text in one call, then tag the match ranges on top of it
+        base_index = self.article_display.index('end-1c')
+        self.article_display.insert(tk.END, text, tag)
+        
+        for start, end in spans:
+            self.article_display.tag_add(
+                "highlight",
+                f"{base_index} + {start} chars",
+                f"{base_index} + {end} chars"
+            )
     
     def include_article(self):
         """Include current article"""
-        if self.all_articles and 0 <= self.current_index < len(self.all_articles):
-            article = self.all_articles[self.current_index].copy()
-            article['Status'] = 'Included'
-            article['Decision_Date'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            
-            self.included_articles.append(article)
-            self.all_articles[self.current_index]['Status'] = 'Included'
-            
-            self.next_article()
+        if 0 <= self.current_index < self.article_count():
+            self.record_decision(INCLUDED)
+            self.advance_to_pending()
     
     def exclude_article(self):
         """Exclude current article"""
-        if self.all_articles and 0 <= self.current_index < len(self.all_articles):
-            article = self.all_articles[self.current_index].copy()
-            article['Status'] = 'Excluded'
-            article['Decision_Date'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            
-            self.excluded_articles.append(article)
-            self.all_articles[self.current_index]['Status'] = 'Excluded'
-            
-            self.next_article()
+        if 0 <= self.current_index < self.article_count():
+            self.record_decision(EXCLUDED)
+            self.advance_to_pending()
+    
+    def record_decision(self, status):
+        """Set the current article's status code and decision time"""
+        i = self.current_index
+        previous = self.status[i]
+        self.status[i] = status
+        # The clock can repeat a reading (or step back); never reuse a stamp
+        self._last_decision_time = max(time.time_ns(), self._last_decision_time + 1)
+        self.decision_times[i] = self._last_decision_time
+        
+        # Re-deciding an article moves it between counts rather than adding to both
+        if previous == INCLUDED:
+            self._n_included -= 1
+        elif previous == EXCLUDED:
+            self._n_excluded -= 1
+        if status == INCLUDED:
+            self._n_included += 1
+        else:
+            self._n_excluded += 1
+    
+    def format_decision_date(self, epoch):
+        """Epoch seconds as local 'YYYY-MM-DD HH:MM:SS', or '' if undecided"""
+        if not epoch:
+            return ''
+        dt = datetime.fromtimestamp(epoch)
+        return (f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d} "
+                f"{dt.hour:02d}:{dt.minute:02d}:{dt.second:02d}")
+    
+    def format_decision_dates(self, times):
+        """Format an array of decision times, converting each distinct second once"""
+        unique, inverse = np.unique(times // 1_000_000_000, return_inverse=True)
+        labels = np.array([self.format_decision_date(epoch) for epoch in unique.tolist()], dtype=object)
+        return labels[inverse].tolist()
+    
+    def decided_in_order(self, status):
+        """Indices of articles with the given status, oldest decision first"""
+        indices = np.flatnonzero(self.status == status)
+        return indices[np.argsort(self.decision_times[indices])]
+    
+    def next_pending(self):
+        """Index of the first undecided article in screening order, or None if all are decided"""
+        pending = self.pending
+        # Drop the decided entries that have reached the front of the queue
+        while pending and self.status[pending[0]] != PENDING:
+            pending.popleft()
+        return pending[0] if pending else None
+    
+    def advance_to_pending(self):
+        """Add the current article to the history and show the next undecided one"""
+        index = self.current_index
+        slot = self._history_slot.get(index)
+        if slot is not None:
+            # Re-decided: blank its earlier entry instead of listing the article twice
+            self.history[slot] = None
+        self._history_slot[index] = len(self.history)
+        self.history.append(index)
+        self._history_pos = len(self.history)
+        
+        next_index = self.next_pending()
+        if next_index is not None:
+            self.current_index = next_index
+            self.update_screening_display()
+        else:
+            self.update_screening_display()
+            messagebox.showinfo("Screening Complete", 
+                              "You have reviewed all articles! Check the Results tab.")
     
     def next_article(self):
-        """Move to next article"""
-        if self.current_index < len(self.all_articles) - 1:
+        """Move forward through the decided articles, then to the next article"""
+        history = self.history
+        pos = self._history_pos + 1
+        while pos < len(history) and history[pos] is None:
+            pos += 1
+        if pos < len(history):
+            self._history_pos = pos
+            self.current_index = history[pos]
+            self.update_screening_display()
+            return
+        
+        # Stepping past the newest decision leaves the history
+        self._history_pos = len(history)
+        if self.current_index < self.article_count() - 1:
             self.current_index += 1
             self.update_screening_display()
+            return
+        
+        # At the last article: go back to the first undecided one, if any remain
+        next_index = self.next_pending()
+        if next_index is not None:
+            self.current_index = next_index
+            self.update_screening_display()
         else:
             messagebox.showinfo("Screening Complete", 
                               "You have reviewed all articles! Check the Results tab.")
     
     def previous_article(self):
-        """Move to previous article"""
-        if self.current_index > 0:
+        """Move back through the decided articles, or one article back if none are decided"""
+        history = self.history
+        pos = self._history_pos - 1
+        while pos >= 0 and history[pos] is None:
+            pos -= 1
+        if pos >= 0:
+            self._history_pos = pos
+            self.current_index = history[pos]
+            self.update_screening_display()
+        elif not history and self.current_index > 0:
             self.current_index -= 1
             self.update_screening_display()
     
     def update_results_summary(self):
         """Update the results summary"""
-        total = len(self.all_articles)
-        included = len(self.included_articles)
-        excluded = len(self.excluded_articles)
+        total = self.article_count()
+        included = self._n_included
+        excluded = self._n_excluded
         pending = total - included - excluded
         
         summary = f"Total Articles: {total} | Included: {included} | Excluded: {excluded} | Pending: {pending}"
         self.stats_var.set(summary)
         
-        # Update results preview
-        self.update_results_preview()
+        # Re-render the preview once decisions pause rather than on every click
+        self._preview_dirty = True
+        if self._preview_job is not None:
+            self.root.after_cancel(self._preview_job)
+        self._preview_job = self.root.after(200, self.refresh_results_preview)
+    
+    def results_tab_visible(self):
+        """Check whether the Results tab is the selected notebook tab"""
+        return self.notebook.select() == str(self.results_frame)
+    
+    def on_tab_changed(self, event):
+        """Render a stale results preview when the Results tab is opened"""
+        if self._preview_dirty and self.results_tab_visible():
+            self.update_results_preview()
+    
+    def refresh_results_preview(self):
+        """Debounced preview refresh; skipped while the Results tab is hidden"""
+        self._preview_job = None
+        if self._preview_dirty and self.results_tab_visible():
+            self.update_results_preview()
     
     def update_results_preview(self):
         """Update the results preview text"""
+        self._preview_dirty = False
         self.results_preview.delete(1.0, tk.END)
         
         # Summary statistics
-        total = len(self.all_articles)
-        included = len(self.included_articles)
-        excluded = len(self.excluded_articles)
+        total = self.article_count()
+        included = self._n_included
+        excluded = self._n_excluded
         pending = total - included - excluded
         
         summary_text = f"""SCREENING SUMMARY
@@ -760,70 +1218,93 @@ Excluded Articles: {excluded}
 Pending Review: {pending}
 
 """
-        self.results_preview.insert(tk.END, summary_text)
-        
-        # Show included articles
-        if self.included_articles:
-            self.results_preview.insert(tk.END, "INCLUDED ARTICLES:\n")
-            self.results_preview.insert(tk.END, "-" * 50 + "\n")
-            for i, article in enumerate(self.included_articles, 1):
-                self.results_preview.insert(tk.END, f"{i}. {article['Title']}\n")
-                self.results_preview.insert(tk.END, f"   Authors: {article['Authors']}\n")
-                self.results_preview.insert(tk.END, f"   {article['ID_Link']}\n")
-                self.results_preview.insert(tk.END, f"   Decision Date: {article.get('Decision_Date', 'N/A')}\n\n")
+        # Build the whole preview in Python and hand it to Tk in one insert
+        parts = [summary_text]
+        titles = self.articles['Title']
+        authors = self.articles['Authors']
+        id_links = self.articles['ID_Link']
+        
+        # Show included articles, one page at a time
+        shown = min(self._preview_limit, self._n_included)
+        if self._n_included:
+            page = self.decided_in_order(INCLUDED)[:shown]
+            dates = self.format_decision_dates(self.decision_times[page])
+            body = "\n".join(f"{i}. {titles[index]}\n"
+                             f"   Authors: {authors[index]}\n"
+                             f"   {id_links[index]}\n"
+                             f"   Decision Date: {decision_date}\n"
+                             for i, (index, decision_date) in enumerate(zip(page.tolist(), dates), 1))
+            parts.append("INCLUDED ARTICLES:\n" + SEP + body + "\n")
+            
+            if self._n_included > shown:
+                parts.append(f"... and {self._n_included - shown} more included articles "
+                             f"(click \"Load more included articles\")\n")
         
         # Show some excluded articles
-        if self.excluded_articles:
-            self.results_preview.insert(tk.END, "\nEXCLUDED ARTICLES (first 5):\n")
-            self.results_preview.insert(tk.END, "-" * 50 + "\n")
-            for i, article in enumerate(self.excluded_articles[:5], 1):
-                self.results_preview.insert(tk.END, f"{i}. {article['Title']}\n")
-                self.results_preview.insert(tk.END, f"   Authors: {article['Authors']}\n")
-                self.results_preview.insert(tk.END, f"   Decision Date: {article.get('Decision_Date', 'N/A')}\n\n")
+        if self._n_excluded:
+            page = self.decided_in_order(EXCLUDED)[:5]
+            dates = self.format_decision_dates(self.decision_times[page])
+            body = "\n".join(f"{i}. {titles[index]}\n"
+                             f"   Authors: {authors[index]}\n"
+                             f"   Decision Date: {decision_date}\n"
+                             for i, (index, decision_date) in enumerate(zip(page.tolist(), dates), 1))
+            parts.append("\nEXCLUDED ARTICLES (first 5):\n" + SEP + body + "\n")
             
-            if len(self.excluded_articles) > 5:
-                self.results_preview.insert(tk.END, f"... and {len(self.excluded_articles) - 5} more excluded articles\n")
+            if self._n_excluded > 5:
+                parts.append(f"... and {self._n_excluded - 5} more excluded articles\n")
+        
+        self.results_preview.insert(tk.END, ''.join(parts))
+        
+        if self._n_included > shown:
+            self.load_more_button.pack(anchor='w', pady=(0,5), before=self.results_preview.frame)
+        else:
+            self.load_more_button.pack_forget()
+    
+    def load_more_preview(self):
+        """Extend the results preview by another page of included articles"""
+        self._preview_limit += PREVIEW_WINDOW
+        self.update_results_preview()
     
     def export_all_results(self):
         """Export all results to CSV"""
-        if not self.all_articles:
+        if not self.article_count():
             messagebox.showwarning("No Data", "No articles to export")
             return
         
         try:
-            # Update all articles with current status
-            for article in self.all_articles:
-                if article['Status'] == 'Included':
-                    # Find the included version with decision date
-                    for inc_article in self.included_articles:
-                        if inc_article['Sr_No'] == article['Sr_No']:
-                            article['Decision_Date'] = inc_article.get('Decision_Date', '')
-                            break
-                elif article['Status'] == 'Excluded':
-                    # Find the excluded version with decision date
-                    for exc_article in self.excluded_articles:
-                        if exc_article['Sr_No'] == article['Sr_No']:
-                            article['Decision_Date'] = exc_article.get('Decision_Date', '')
-                            break
-            
-            df = pd.DataFrame(self.all_articles)
             filename = f"all_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
-            df.to_csv(filename, index=False)
+            self.write_articles_csv(filename)
             
             messagebox.showinfo("Export Successful", f"All results exported to {filename}")
         except Exception as e:
             messagebox.showerror("Export Error", f"Error exporting results: {e}")
     
+    def write_articles_csv(self, filename, status=None):
+        """Stream articles, optionally only those with the given status code, to CSV"""
+        if status is None:
+            indices = np.arange(self.article_count())
+            columns = [self.articles[field] for field in ARTICLE_FIELDS]
+        else:
+            indices = np.flatnonzero(self.status == status)
+            positions = indices.tolist()
+            columns = [[self.articles[field][i] for i in positions] for field in ARTICLE_FIELDS]
+        
+        # Status and decision date come from the decision arrays, labelled only here
+        columns.append(STATUS_LABELS[self.status[indices]].tolist())
+        columns.append(self.format_decision_dates(self.decision_times[indices]))
+        
+        with open_csv_for_writing(filename) as f:
+            write_csv_columns(f, EXPORT_FIELDS, columns)
+    
     def export_included(self):
         """Export included articles to CSV"""
-        if not self.included_articles:
+        if not self._n_included:
             messagebox.showwarning("No Data", "No included articles to export")
             return
         
         try:
-            df = pd.DataFrame(self.included_articles)
             filename = f"included_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
-            df.to_csv(filename, index=False)
+            self.write_articles_csv(filename, INCLUDED)
             
             messagebox.showinfo("Export Successful", f"Included articles exported to {filename}")
         except Exception as e:
@@ -831,14 +1312,13 @@ Pending Review: {pending}
     
     def export_excluded(self):
         """Export excluded articles to CSV"""
-        if not self.excluded_articles:
+        if not self._n_excluded:
             messagebox.showwarning("No Data", "No excluded articles to export")
             return
         
         try:
-            df = pd.DataFrame(self.excluded_articles)
             filename = f"excluded_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
-            df.to_csv(filename, index=False)
+            self.write_articles_csv(filename, EXCLUDED)
             
             messagebox.showinfo("Export Successful", f"Excluded articles exported to {filename}")
         except Exception as e:
@@ -868,12 +1348,12 @@ def main():
     # Create and run the application
     app = SystematicReviewTool(root)
     
-    # Center window on screen
+    # Center window on screen: one layout pass, then read the size in a single query
     root.update_idletasks()
-    width = root.winfo_width()
-    height = root.winfo_height()
-    x = (root.winfo_screenwidth() // 2) - (width // 2)
-    y = (root.winfo_screenheight() // 2) - (height // 2)
+    width, height = map(int, root.winfo_geometry().split('+', 1)[0].split('x'))
+    screen_width, screen_height = root.winfo_screenwidth(), root.winfo_screenheight()
+    x = (screen_width // 2) - (width // 2)
+    y = (screen_height // 2) - (height // 2)
     root.geometry(f'{width}x{height}+{x}+{y}')
     
     root.mainloop()